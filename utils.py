@@ -5,32 +5,196 @@ This module provides utility functions for processing and visualizing
 NFL player tracking data, including trajectory extraction and field visualization.
 """
 
+import os
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Render headlessly (e.g. batch plotting over many plays) when requested
+if os.environ.get('DATABOWL_AGG'):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from const import *
 
 
-def extract_points(play_group):
+# Compact dtypes for tracking columns; positions only carry 2 decimal places
+TRACKING_DTYPES = {
+    X: 'float32',
+    Y: 'float32',
+    BALL_LAND_X: 'float32',
+    BALL_LAND_Y: 'float32',
+    GAME_ID: 'int32',
+    PLAY_ID: 'int32',
+    NFL_ID: 'int32',
+    FRAME_ID: 'int16',
+}
+
+# Player roles considered part of the offense
+_OFF_ROLES = {'Other Route Runner', 'Passer', 'Targeted Receiver'}
+
+# Plot extent (xmin, xmax, ymin, ymax) showing the full field plus endzones
+FIELD_EXTENT = (-10, 130, -5, 58.3)
+
+# RGBA colors of the tab10 colormap, used to color players
+_TAB10 = plt.cm.tab10(np.arange(10))
+
+# Trajectory end arrow dimensions, in yards
+_ARROW_WIDTH = 0.15
+_ARROW_HEAD_WIDTH = 2
+_ARROW_HEAD_LENGTH = 1.5
+
+# Pre-rendered RGBA image of the football field, built on first use
+_FIELD_BG = None
+
+
+def load_tracking(path, game_id=None, play_id=None):
     """
-    Extract (x, y) coordinate tuples from a player's dataframe.
+    Load a tracking data file (CSV or Parquet) with compact column dtypes.
+    
+    Coordinates are downcast to float32 and identifiers to 32/16-bit integers
+    (see TRACKING_DTYPES), roughly halving the memory of those columns.
+    
+    When game_id and/or play_id are given, only matching rows are returned.
+    For Parquet files the filter is pushed down to the reader, so row groups
+    that cannot match (see save_tracking) are never decompressed; CSV files
+    are read in full and then filtered.
+    
+    Args:
+        path (str): Path to a .csv or .parquet tracking file
+        game_id (int, optional): Only load rows for this game
+        play_id (int, optional): Only load rows for this play
+        
+    Returns:
+        pd.DataFrame: Tracking data with downcast dtypes
+        
+    Example:
+        >>> df = load_tracking('./kaggle/input/nfl-big-data-bowl-2026-prediction/train/input_2023_w01.csv')
+        >>> play_df = load_tracking('tracking_w01.parquet', game_id=2023090800, play_id=56)
+    """
+    filters = []
+    if game_id is not None:
+        filters.append((GAME_ID, '==', game_id))
+    if play_id is not None:
+        filters.append((PLAY_ID, '==', play_id))
+    
+    if str(path).endswith('.parquet'):
+        df = pd.read_parquet(path, filters=filters or None)
+    else:
+        df = pd.read_csv(path)
+        for col, _, value in filters:
+            df = df[df[col] == value]
+    return df.astype({col: dtype for col, dtype in TRACKING_DTYPES.items() if col in df.columns})
+
+
+def save_tracking(df, path, row_group_size=100_000):
+    """
+    Save tracking data to Parquet, laid out for filtered reads with load_tracking.
+    
+    Rows are sorted by game, play, player and frame so each row group covers a
+    narrow range of GAME_ID/PLAY_ID values and its statistics let the reader
+    skip it when filtering.
+    
+    Args:
+        df (pd.DataFrame): DataFrame with player tracking data
+        path (str): Destination .parquet path
+        row_group_size (int, optional): Maximum number of rows per row group
+        
+    Example:
+        >>> save_tracking(load_tracking('input_2023_w01.csv'), 'tracking_w01.parquet')
+    """
+    sort_cols = [col for col in (GAME_ID, PLAY_ID, NFL_ID, FRAME_ID) if col in df.columns]
+    df.sort_values(sort_cols).to_parquet(path, index=False, row_group_size=row_group_size)
+
+
+def prep_df(df):
+    """
+    Convert repeated identifier columns to categorical dtype.
+    
+    Call once after loading; filtering with is_offensive_player and grouping
+    by player then operate on small integer codes instead of Python objects.
+    
+    Args:
+        df (pd.DataFrame): DataFrame with player tracking data
+        
+    Returns:
+        pd.DataFrame: Copy of df with NFL_ID, PLAYER_NAME and PLAYER_ROLE as categoricals
+        
+    Example:
+        >>> df = prep_df(pd.read_csv('input_2023_w01.csv'))
+    """
+    columns = [col for col in (NFL_ID, PLAYER_NAME, PLAYER_ROLE) if col in df.columns]
+    return df.astype({col: 'category' for col in columns})
+
+
+def extract_points(play_group, as_tuples=False):
+    """
+    Extract (x, y) coordinates from a player's dataframe.
     
     Args:
         play_group (pd.DataFrame): DataFrame with X and Y columns for a single player
+        as_tuples (bool, optional): Return a list of (x, y) tuples instead of an array
         
     Returns:
-        list: List of (x, y) tuples representing the player's trajectory
+        np.ndarray: Array of shape (N, 2) representing the player's trajectory,
+            or a list of (x, y) tuples if as_tuples is True
         
     Example:
         >>> player_data = df[df[NFL_ID] == 12345]
         >>> points = extract_points(player_data)
-        >>> # [(x1, y1), (x2, y2), ...]
+        >>> # array([[x1, y1], [x2, y2], ...])
     """
-    points = list(zip(play_group[X], play_group[Y]))
+    points = play_group[[X, Y]].to_numpy()
+    if as_tuples:
+        return [tuple(p) for p in points.tolist()]
     return points
 
 
+def build_play_index(df):
+    """
+    Index a tracking dataframe by (GAME_ID, PLAY_ID) for fast per-play lookups.
+    
+    Build this once and pass the result to get_player_points_array when
+    looping over many plays; each lookup then slices the sorted index instead
+    of scanning the full dataframe.
+    
+    Args:
+        df (pd.DataFrame): DataFrame with player tracking data
+        
+    Returns:
+        pd.DataFrame: The same data with a sorted (GAME_ID, PLAY_ID) MultiIndex
+        
+    Example:
+        >>> indexed_df = build_play_index(df)
+        >>> points, labels, ball_land = get_player_points_array(indexed_df, 2023090800, 56)
+    """
+    return df.set_index([GAME_ID, PLAY_ID]).sort_index()
+
+
+def _is_player_frame_sorted(play_df):
+    """
+    Check whether rows are already ordered by NFL_ID, then FRAME_ID.
+    
+    Args:
+        play_df (pd.DataFrame): Tracking rows for a single play
+        
+    Returns:
+        bool: True if sorting by [NFL_ID, FRAME_ID] would not reorder the rows
+    """
+    if not play_df[NFL_ID].is_monotonic_increasing:
+        return False
+    nfl_ids = play_df[NFL_ID].to_numpy()
+    same_player = nfl_ids[1:] == nfl_ids[:-1]
+    return bool((np.diff(play_df[FRAME_ID].to_numpy())[same_player] >= 0).all())
+
+
 def get_player_points_array(df, game_id, play_id):
     """
     Extract points for all players in a specific game and play.
@@ -38,14 +202,18 @@ def get_player_points_array(df, game_id, play_id):
     This function filters the dataframe to a specific game/play combination,
     groups by player, and extracts their trajectories in frame order.
     
+    If df has been indexed with build_play_index, the play is selected with an
+    index lookup rather than a boolean mask over the whole dataframe.
+    
     Args:
-        df (pd.DataFrame): DataFrame with player tracking data
+        df (pd.DataFrame): DataFrame with player tracking data, optionally
+            indexed by build_play_index
         game_id (int): Game identifier
         play_id (int): Play identifier
         
     Returns:
         tuple: A 3-tuple containing:
-            - points_array (list): List of lists of (x, y) tuples, one per player
+            - points_array (list): List of (T, 2) arrays of (x, y) positions, one per player
             - labels (list): List of player labels/names
             - ball_land (tuple): Tuple of (x, y) for ball landing, or None if unavailable
             
@@ -55,34 +223,40 @@ def get_player_points_array(df, game_id, play_id):
         >>> print(f"Ball landed at: {ball_land}")
     """
     # Filter to specific game and play
-    play_df = df[(df[GAME_ID] == game_id) & (df[PLAY_ID] == play_id)]
-    
-    # Sort by frame to ensure correct order
-    play_df = play_df.sort_values(FRAME_ID)
-    
-    points_array = []
-    labels = []
+    if isinstance(df.index, pd.MultiIndex):
+        try:
+            play_df = df.loc[[(game_id, play_id)]]
+        except KeyError:
+            play_df = df.iloc[:0]
+    else:
+        play_df = df[(df[GAME_ID] == game_id) & (df[PLAY_ID] == play_id)]
+    
+    # Sort by player, then frame, so each player's trajectory is contiguous
+    # (skipped when the data is already stored in that order)
+    if not _is_player_frame_sorted(play_df):
+        play_df = play_df.sort_values([NFL_ID, FRAME_ID])
+    
+    if play_df.empty:
+        return [], [], None
     
     # Get ball landing position (should be same for all rows in this play)
     ball_land = None
     if BALL_LAND_X in play_df.columns and BALL_LAND_Y in play_df.columns:
-        ball_x = play_df[BALL_LAND_X].iloc[0]
-        ball_y = play_df[BALL_LAND_Y].iloc[0]
-        if pd.notna(ball_x) and pd.notna(ball_y):
-            ball_land = (ball_x, ball_y)
-    
-    # Group by player (NFL_ID)
-    for nfl_id, player_group in play_df.groupby(NFL_ID):
-        # Extract points for this player
-        points = list(zip(player_group[X], player_group[Y]))
-        points_array.append(points)
-        
-        # Create label (use player name if available, otherwise NFL_ID)
-        if PLAYER_NAME in player_group.columns:
-            player_name = player_group[PLAYER_NAME].iloc[0]
-            labels.append(player_name)
-        else:
-            labels.append(f'Player {nfl_id}')
+        ball_xy = play_df[[BALL_LAND_X, BALL_LAND_Y]].to_numpy()[0]
+        if np.isfinite(ball_xy).all():
+            ball_land = tuple(ball_xy)
+    
+    # Split into per-player chunks wherever NFL_ID changes
+    nfl_ids = play_df[NFL_ID].to_numpy()
+    cuts = np.flatnonzero(nfl_ids[1:] != nfl_ids[:-1]) + 1
+    starts = np.concatenate(([0], cuts))
+    points_array = np.split(play_df[[X, Y]].to_numpy(), cuts)
+    
+    # Create labels (use player name if available, otherwise NFL_ID)
+    if PLAYER_NAME in play_df.columns:
+        labels = play_df[PLAYER_NAME].to_numpy()[starts].tolist()
+    else:
+        labels = [f'Player {nfl_id}' for nfl_id in nfl_ids[starts]]
     
     return points_array, labels, ball_land
 
@@ -100,34 +274,75 @@ def is_offensive_player(player_role):
     Example:
         >>> off_df = df[is_offensive_player(df[PLAYER_ROLE])]
     """
-    return player_role.isin(['Other Route Runner', 'Passer', 'Targeted Receiver'])
+    return player_role.isin(_OFF_ROLES)
 
 
-def plot_multiple_points(points_array, ball_land=None, game_id=None, play_id=None, labels=None):
+def downsample_points(points, max_points=None):
     """
-    Plot multiple player trajectories on a football field visualization.
+    Thin a trajectory to at most max_points evenly spaced points.
     
-    Creates an interactive football field plot with:
-    - Green field background with endzones
-    - White yard lines and sidelines
-    - Colored player trajectories with arrows showing direction
-    - Optional ball landing position marked with a star
+    The first and last points are always kept so start positions and end
+    arrows are unaffected.
     
     Args:
-        points_array (list): List of lists of (x, y) tuples - [[points1], [points2], ...]
-        ball_land (tuple, optional): Tuple of (x, y) for ball landing position
-        game_id (int, optional): Game identifier for title
-        play_id (int, optional): Play identifier for title
-        labels (list, optional): List of player labels for legend
+        points (np.ndarray or list): Array of shape (N, 2) or list of (x, y) tuples
+        max_points (int, optional): Maximum number of points to keep; None keeps all
+        
+    Returns:
+        np.ndarray: Array of shape (min(N, max_points), 2)
         
     Example:
-        >>> points, labels, ball_land = get_player_points_array(df, game_id, play_id)
-        >>> plot_multiple_points(points, ball_land, game_id, play_id, labels)
+        >>> downsample_points(points, max_points=50)
     """
-    # Create the plot
-    fig, ax = plt.subplots(figsize=(12, 5))
+    xy = np.asarray(points)
+    if max_points is None or len(xy) <= max_points:
+        return xy
+    if max_points < 2:
+        raise ValueError(f'max_points must be at least 2, got {max_points}')
+    
+    idx = np.linspace(0, len(xy) - 1, max_points).round().astype(np.intp)
+    return xy[idx]
+
+
+@lru_cache(maxsize=None)
+def _player_colors(n_players):
+    """
+    Return RGBA colors for n_players, cycling through tab10.
+    
+    Plays almost always have the same number of players (22), so the color
+    table is built once per player count and shared across calls.
+    
+    Args:
+        n_players (int): Number of players to color
+        
+    Returns:
+        np.ndarray: Read-only (n_players, 4) RGBA array
+    """
+    colors = _TAB10[np.arange(n_players) % len(_TAB10)]
+    colors.setflags(write=False)
+    return colors
+
+
+def _get_field_background():
+    """
+    Return the RGBA image of the football field, rendering it on first use.
+    
+    The field artwork (endzones, yard lines, sidelines) never changes, so it is
+    drawn once into an offscreen Agg canvas and reused as a single image.
+    
+    Returns:
+        np.ndarray: RGBA array covering FIELD_EXTENT
+    """
+    global _FIELD_BG
+    if _FIELD_BG is not None:
+        return _FIELD_BG
+    
+    fig = Figure(figsize=(14, 6.33), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    fig.patch.set_facecolor('#2d5016')
     
-    # Draw football field background
     # Main field (green)
     field = patches.Rectangle((0, 0), 120, 53.3, linewidth=2, 
                               edgecolor='white', facecolor='#2d5016', zorder=0)
@@ -149,38 +364,185 @@ def plot_multiple_points(points_array, ball_land=None, game_id=None, play_id=Non
     ax.plot([0, 120], [0, 0], 'w-', linewidth=2, zorder=1)
     ax.plot([0, 120], [53.3, 53.3], 'w-', linewidth=2, zorder=1)
     
+    ax.set_xlim(FIELD_EXTENT[0], FIELD_EXTENT[1])
+    ax.set_ylim(FIELD_EXTENT[2], FIELD_EXTENT[3])
+    
+    fig.canvas.draw()
+    _FIELD_BG = np.asarray(fig.canvas.buffer_rgba()).copy()
+    return _FIELD_BG
+
+
+def _finish_figure(fig, save_to, owns_figure):
+    """
+    Save, show or leave a finished figure.
+    
+    Args:
+        fig (Figure): Figure that was drawn on
+        save_to (str, optional): Path to write the figure to instead of showing it
+        owns_figure (bool): Whether the plotting function created fig itself
+    """
+    if save_to is not None:
+        fig.savefig(save_to)
+        if owns_figure:
+            # Release the Agg buffer; callers looping over plays would otherwise leak figures
+            plt.close(fig)
+    elif owns_figure:
+        plt.show()
+
+
+def draw_field(ax):
+    """
+    Draw the football field background on an axes.
+    
+    The field is a single cached image, so it only needs to be drawn once per
+    axes; use draw_trajectories to add (and later remove) each play on top.
+    
+    Args:
+        ax (Axes): Axes to draw on
+        
+    Returns:
+        AxesImage: The field image artist
+        
+    Example:
+        >>> fig, ax = plt.subplots(figsize=(12, 5))
+        >>> draw_field(ax)
+    """
+    # Draw football field background from the cached image
+    field = ax.imshow(_get_field_background(), extent=FIELD_EXTENT, aspect='auto', zorder=0)
+    
     # Set limits to show full field with buffer (endzones)
-    ax.set_xlim(-10, 130)
-    ax.set_ylim(-5, 58.3)
+    ax.set_xlim(FIELD_EXTENT[0], FIELD_EXTENT[1])
+    ax.set_ylim(FIELD_EXTENT[2], FIELD_EXTENT[3])
+    ax.set_facecolor('#2d5016')
+    
+    return field
+
+
+def draw_trajectories(ax, points_array, ball_land=None, labels=None, max_points=None):
+    """
+    Draw player trajectories, the ball landing position and a legend on an axes.
+    
+    All artists for the play are returned so callers looping over plays can
+    remove them and redraw without rebuilding the field.
+    
+    Args:
+        ax (Axes): Axes to draw on, usually prepared with draw_field
+        points_array (list): List of (T, 2) arrays or lists of (x, y) tuples, one per player
+        ball_land (tuple, optional): Tuple of (x, y) for ball landing position
+        labels (list, optional): List of player labels for legend
+        max_points (int, optional): Cap on points drawn per player; long trajectories
+            are downsampled with downsample_points
+            
+    Returns:
+        list: Artists added to the axes
+        
+    Example:
+        >>> draw_field(ax)
+        >>> for play_id in play_ids:
+        ...     points, labels, ball_land = get_player_points_array(df, game_id, play_id)
+        ...     artists = draw_trajectories(ax, points, ball_land, labels)
+        ...     fig.savefig(f'{game_id}_{play_id}.png')
+        ...     for artist in artists:
+        ...         artist.remove()
+    """
+    artists = []
     
-    # Plot each trajectory
-    colors = plt.cm.tab10(range(len(points_array)))  # Get distinct colors
+    # Plot all trajectories as batched collections (one artist each for
+    # lines, markers and arrows instead of one per player)
+    segments = [downsample_points(points, max_points) for points in points_array]
     
-    for i, points in enumerate(points_array):
-        # Extract x and y coordinates
-        x_coords = [p[0] for p in points]
-        y_coords = [p[1] for p in points]
+    legend_handles = []
+    if segments:
+        colors = _player_colors(len(segments))  # Get distinct colors
+        lines = LineCollection(segments, colors=colors, linewidths=2, alpha=0.9, zorder=2)
+        artists.append(ax.add_collection(lines, autolim=False))
         
-        # Determine label
-        label = labels[i] if labels and i < len(labels) else f'Player {i+1}'
+        # Markers for every point, colored by player
+        all_xy = np.concatenate(segments)
+        point_colors = np.repeat(colors, [len(xy) for xy in segments], axis=0)
+        artists.append(ax.scatter(all_xy[:, 0], all_xy[:, 1], s=25, c=point_colors, 
+                                  alpha=0.9, zorder=2))
         
-        # Plot the trajectory
-        ax.plot(x_coords, y_coords, '-o', markersize=5, linewidth=2, 
-                color=colors[i], label=label, alpha=0.9, zorder=2)
+        # Add arrow at the end of each trajectory, all in a single quiver;
+        # each arrow runs from the second-to-last point with its head extending
+        # _ARROW_HEAD_LENGTH yards past the last point
+        ends = [(xy[-2], xy[-1], colors[i]) for i, xy in enumerate(segments) if len(xy) >= 2]
+        if ends:
+            tails, heads, arrow_colors = (np.array(v) for v in zip(*ends))
+            deltas = heads - tails
+            lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+            moving = lengths > 0
+            if moving.any():
+                tails, deltas, lengths = tails[moving], deltas[moving], lengths[moving]
+                vectors = deltas * (1 + _ARROW_HEAD_LENGTH / lengths)[:, None]
+                artists.append(ax.quiver(
+                    tails[:, 0], tails[:, 1], vectors[:, 0], vectors[:, 1],
+                    color=arrow_colors[moving], edgecolor=arrow_colors[moving], linewidth=1,
+                    angles='xy', scale_units='xy', scale=1, units='xy', 
+                    width=_ARROW_WIDTH, headwidth=_ARROW_HEAD_WIDTH / _ARROW_WIDTH, 
+                    headlength=_ARROW_HEAD_LENGTH / _ARROW_WIDTH, 
+                    headaxislength=_ARROW_HEAD_LENGTH / _ARROW_WIDTH, zorder=3))
         
-        # Add arrow at the end
-        if len(points) >= 2:
-            dx = x_coords[-1] - x_coords[-2]
-            dy = y_coords[-1] - y_coords[-2]
-            ax.arrow(x_coords[-2], y_coords[-2], dx, dy, 
-                     head_width=2, head_length=1.5, 
-                     fc=colors[i], ec=colors[i], linewidth=2, zorder=3)
+        # Legend entries (proxy artists, not drawn on the axes)
+        for i in range(len(segments)):
+            label = labels[i] if labels and i < len(labels) else f'Player {i+1}'
+            legend_handles.append(Line2D([], [], marker='o', markersize=5, linewidth=2, 
+                                         color=colors[i], alpha=0.9, label=label))
     
     # Plot ball landing position
     if ball_land is not None:
-        ax.plot(ball_land[0], ball_land[1], marker='*', markersize=20, 
-                color='yellow', markeredgecolor='black', markeredgewidth=2,
-                label='Ball Landing', zorder=4)
+        ball, = ax.plot(ball_land[0], ball_land[1], marker='*', markersize=20, 
+                        color='yellow', markeredgecolor='black', markeredgewidth=2,
+                        label='Ball Landing', zorder=4)
+        artists.append(ball)
+        legend_handles.append(ball)
+    
+    artists.append(ax.legend(handles=legend_handles, facecolor='#1a1a1a', 
+                             edgecolor='white', labelcolor='white'))
+    
+    return artists
+
+
+def plot_multiple_points(points_array, ball_land=None, game_id=None, play_id=None, labels=None,
+                         ax=None, save_to=None, max_points=None):
+    """
+    Plot multiple player trajectories on a football field visualization.
+    
+    Creates an interactive football field plot with:
+    - Green field background with endzones
+    - White yard lines and sidelines
+    - Colored player trajectories with arrows showing direction
+    - Optional ball landing position marked with a star
+    
+    Args:
+        points_array (list): List of (T, 2) arrays or lists of (x, y) tuples, one per player
+        ball_land (tuple, optional): Tuple of (x, y) for ball landing position
+        game_id (int, optional): Game identifier for title
+        play_id (int, optional): Play identifier for title
+        labels (list, optional): List of player labels for legend
+        ax (Axes, optional): Axes to draw on; a new figure is created if omitted
+            and the figure is only shown when the function created it
+        save_to (str, optional): Path to save the figure to instead of showing it
+        max_points (int, optional): Cap on points drawn per player; long trajectories
+            are downsampled with downsample_points
+        
+    Example:
+        >>> points, labels, ball_land = get_player_points_array(df, game_id, play_id)
+        >>> plot_multiple_points(points, ball_land, game_id, play_id, labels)
+        >>> plot_multiple_points(points, ball_land, game_id, play_id, labels,
+        ...                      save_to=f'{game_id}_{play_id}.png')
+    """
+    # Create the plot
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(12, 5))
+    else:
+        fig = ax.figure
+    
+    # Draw the static field, then this play's trajectories
+    draw_field(ax)
+    draw_trajectories(ax, points_array, ball_land=ball_land, labels=labels, 
+                      max_points=max_points)
     
     # Labels and grid
     ax.set_xlabel('X (yards)', color='white', fontsize=12)
@@ -192,26 +554,28 @@ def plot_multiple_points(points_array, ball_land=None, game_id=None, play_id=Non
     ax.set_title(title, color='white', fontsize=14, fontweight='bold')
     
     # Style adjustments for football field look
-    ax.set_facecolor('#2d5016')
     fig.patch.set_facecolor('#1a1a1a')
     ax.tick_params(colors='white')
-    ax.legend(facecolor='#1a1a1a', edgecolor='white', labelcolor='white')
     ax.set_aspect('auto')
     
-    plt.tight_layout()
-    plt.show()
+    if owns_figure:
+        fig.tight_layout()
+    _finish_figure(fig, save_to, owns_figure)
 
 
-def plot_single_trajectory(points, game_id=None, play_id=None):
+def plot_single_trajectory(points, game_id=None, play_id=None, ax=None, save_to=None):
     """
     Plot a single player's trajectory on a football field.
     
     Simplified version of plot_multiple_points for visualizing a single player.
     
     Args:
-        points (list): List of (x, y) tuples representing trajectory
+        points (np.ndarray or list): Array of shape (N, 2) or list of (x, y) tuples
+            representing trajectory
         game_id (int, optional): Game identifier for title
         play_id (int, optional): Play identifier for title
+        ax (Axes, optional): Axes to draw on; a new figure is created if omitted
+        save_to (str, optional): Path to save the figure to instead of showing it
         
     Example:
         >>> qb_data = df[df[PLAYER_ROLE] == 'Passer']
@@ -219,34 +583,38 @@ def plot_single_trajectory(points, game_id=None, play_id=None):
         >>> plot_single_trajectory(points, game_id, play_id)
     """
     # Extract x and y coordinates
-    x_coords = [p[0] for p in points]
-    y_coords = [p[1] for p in points]
+    xy = np.asarray(points)
+    x_coords, y_coords = xy[:, 0], xy[:, 1]
     
     # Create the plot
-    plt.figure(figsize=(12, 5))
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(12, 5))
+    else:
+        fig = ax.figure
     
     # Set limits to show full field with buffer
-    plt.xlim(-5, 125)
-    plt.ylim(-5, 58)
+    ax.set_xlim(-5, 125)
+    ax.set_ylim(-5, 58)
     
     # Plot the points
-    plt.plot(x_coords, y_coords, 'b-o', markersize=4, linewidth=1)
+    ax.plot(x_coords, y_coords, 'b-o', markersize=4, linewidth=1)
     
     # Mark start and end
-    plt.plot(x_coords[0], y_coords[0], 'go', markersize=10, label='Start')
-    plt.plot(x_coords[-1], y_coords[-1], 'ro', markersize=10, label='End')
+    ax.plot(x_coords[0], y_coords[0], 'go', markersize=10, label='Start')
+    ax.plot(x_coords[-1], y_coords[-1], 'ro', markersize=10, label='End')
     
     # Labels and grid
-    plt.xlabel('X (yards)')
-    plt.ylabel('Y (yards)')
+    ax.set_xlabel('X (yards)')
+    ax.set_ylabel('Y (yards)')
     
     title = 'Player Trajectory'
     if game_id and play_id:
         title = f'Game: {game_id}, Play: {play_id}'
-    plt.title(title)
+    ax.set_title(title)
     
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.gca().set_aspect('auto')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_aspect('auto')
     
-    plt.show()
\ No newline at end of file
+    _finish_figure(fig, save_to, owns_figure)
@@ -0,0 +1,62 @@
+"""
+NFL Big Data Bowl 2026 - Compiled Trajectory Helpers
+
+This module provides Numba-compiled numeric helpers for player trajectories,
+such as per-frame speed, heading and cumulative distance.
+
+Numba is optional: without it the same functions run as plain Python.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Tracking data is sampled at 10 frames per second
+FRAME_RATE_HZ = 10.0
+
+
+@njit(cache=True, fastmath=True)
+def trajectory_features(xy):
+    """
+    Compute per-frame movement features from a player's trajectory.
+
+    Args:
+        xy (np.ndarray): Array of shape (N, 2) of (x, y) positions in frame order
+
+    Returns:
+        tuple: A 3-tuple of float32 arrays of length N:
+            - speed: Yards per second between the previous and current frame
+            - heading: Direction of travel in radians (atan2 of dy, dx)
+            - cum_dist: Cumulative distance travelled in yards
+            The first frame has zero speed, heading and distance.
+
+    Example:
+        >>> points = extract_points(player_data)
+        >>> speed, heading, cum_dist = trajectory_features(points)
+    """
+    n = xy.shape[0]
+    speed = np.zeros(n, dtype=np.float32)
+    heading = np.zeros(n, dtype=np.float32)
+    cum_dist = np.zeros(n, dtype=np.float32)
+
+    total = 0.0
+    for i in range(1, n):
+        dx = xy[i, 0] - xy[i - 1, 0]
+        dy = xy[i, 1] - xy[i - 1, 1]
+        dist = math.sqrt(dx * dx + dy * dy)
+        total += dist
+        speed[i] = dist * FRAME_RATE_HZ
+        heading[i] = math.atan2(dy, dx)
+        cum_dist[i] = total
+
+    return speed, heading, cum_dist